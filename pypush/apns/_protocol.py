@@ -15,6 +15,13 @@ def command(cls: T) -> T:
     Automatically add from_packet and to_packet methods to a dataclass
     """
 
+    # The set of field IDs is fixed per class, so only compute it once
+    known_packet_ids = frozenset(
+        f.metadata["packet_id"]
+        for f in dataclass_fields(cls)  # type: ignore
+        if f.metadata is not None and "packet_id" in f.metadata
+    )
+
     def from_packet(cls, packet: Packet):
         assert packet.id == cls.PacketType
         field_values = {}
@@ -68,11 +75,7 @@ def command(cls: T) -> T:
 
         # Check for extra fields
         for current_field in packet.fields:
-            if current_field.id not in [
-                f.metadata["packet_id"]
-                for f in dataclass_fields(cls)
-                if f.metadata is not None and "packet_id" in f.metadata
-            ]:
+            if current_field.id not in known_packet_ids:
                 logging.warning(
                     f"Unexpected field with packet ID {current_field.id} in packet {packet}"
                 )
@@ -4,8 +4,10 @@ import plistlib
 import re
 import uuid
 from base64 import b64decode
+from functools import lru_cache
 from typing import Optional, Tuple
 
+import anyio.to_thread
 import httpx
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -21,17 +23,39 @@ FAIRPLAY_CERT_CHAIN = b64decode(
 )
 
 
+# Everything in the CSR subject except the common name is fixed
+_CSR_SUBJECT_ATTRIBUTES = (
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "CA"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "Cupertino"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Apple Inc."),
+    x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "iPhone"),
+)
+
+
+@lru_cache(maxsize=None)
+def _fairplay_key() -> rsa.RSAPrivateKey:
+    # Parsing the PEM is comparatively expensive, and the key never changes
+    key = serialization.load_pem_private_key(
+        FAIRPLAY_PRIVATE_KEY, password=None, backend=default_backend()
+    )
+    assert isinstance(key, rsa.RSAPrivateKey)
+    return key
+
+
+def _generate_private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(
+        public_exponent=65537, key_size=1024, backend=default_backend()
+    )
+
+
 def _generate_csr(private_key: rsa.RSAPrivateKey, name: str = str(uuid.uuid4())) -> str:
     csr = (
         x509.CertificateSigningRequestBuilder()
         .subject_name(
             x509.Name(
                 [
-                    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-                    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "CA"),
-                    x509.NameAttribute(NameOID.LOCALITY_NAME, "Cupertino"),
-                    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Apple Inc."),
-                    x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "iPhone"),
+                    *_CSR_SUBJECT_ATTRIBUTES,
                     x509.NameAttribute(NameOID.COMMON_NAME, name),
                 ]
             )
@@ -50,13 +74,13 @@ async def activate(
     build: str = "10.6.4",
     model: str = "windows1,1",
 ) -> Tuple[x509.Certificate, rsa.RSAPrivateKey]:
+    owns_client = http_client is None
     if http_client is None:
         # Do this here to ensure the client is not accidentally reused during tests
         http_client = httpx.AsyncClient()
 
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=1024, backend=default_backend()
-    )
+    # Prime search is CPU bound, keep it off the event loop
+    private_key = await anyio.to_thread.run_sync(_generate_private_key)
     csr = _generate_csr(private_key)
 
     activation_info = plistlib.dumps(
@@ -73,39 +97,40 @@ async def activate(
         }
     )
 
-    fairplay_key = serialization.load_pem_private_key(
-        FAIRPLAY_PRIVATE_KEY, password=None, backend=default_backend()
-    )
-    assert isinstance(fairplay_key, rsa.RSAPrivateKey)
-
-    signature = fairplay_key.sign(activation_info, padding.PKCS1v15(), hashes.SHA1())
-
-    resp = await http_client.post(
-        f"https://albert.apple.com/deviceservices/deviceActivation?device={device_class}",
-        data={
-            "activation-info": plistlib.dumps(
-                {
-                    "ActivationInfoComplete": True,
-                    "ActivationInfoXML": activation_info,
-                    "FairPlayCertChain": FAIRPLAY_CERT_CHAIN,
-                    "FairPlaySignature": signature,
-                }
-            ).decode()
-        },
-    )
+    signature = _fairplay_key().sign(activation_info, padding.PKCS1v15(), hashes.SHA1())
 
     try:
-        protocol = re.search("<Protocol>(.*)</Protocol>", resp.text).group(1)  # type: ignore
-    except AttributeError as e:
+        resp = await http_client.post(
+            f"https://albert.apple.com/deviceservices/deviceActivation?device={device_class}",
+            data={
+                "activation-info": plistlib.dumps(
+                    {
+                        "ActivationInfoComplete": True,
+                        "ActivationInfoXML": activation_info,
+                        "FairPlayCertChain": FAIRPLAY_CERT_CHAIN,
+                        "FairPlaySignature": signature,
+                    }
+                ).decode()
+            },
+        )
+    finally:
+        # Callers that want connection reuse across activations pass their own client
+        if owns_client:
+            await http_client.aclose()
+
+    protocol = re.search("<Protocol>(.*)</Protocol>", resp.text)
+    if protocol is None:
         # Search for error text between <b> and </b>
-        error = re.search("<b>(.*)</b>", resp.text).group(1)  # type: ignore
-        raise Exception(f"Failed to get certificate from Albert: {error}") from e
+        error = re.search("<b>(.*)</b>", resp.text)
+        raise Exception(
+            f"Failed to get certificate from Albert: {error.group(1) if error else resp.text}"
+        )
 
-    protocol = plistlib.loads(protocol.encode("utf-8"))
+    activation_record = plistlib.loads(protocol.group(1).encode("utf-8"))[
+        "device-activation"
+    ]["activation-record"]
 
     return (
-        x509.load_pem_x509_certificate(
-            protocol["device-activation"]["activation-record"]["DeviceCertificate"]
-        ),
+        x509.load_pem_x509_certificate(activation_record["DeviceCertificate"]),
         private_key,
     )
@@ -96,20 +96,22 @@ class PacketStream(ObjectStream[Packet]):
     transport_stream: ByteStream
 
     def _serialize_field(self, field: Packet.Field) -> bytes:
-        return (
-            field.id.to_bytes(1, "big")
-            + len(field.value).to_bytes(2, "big")
-            + field.value
+        return b"".join(
+            (
+                field.id.to_bytes(1, "big"),
+                len(field.value).to_bytes(2, "big"),
+                field.value,
+            )
         )
 
     def _serialize_packet(self, packet: Packet) -> bytes:
-        payload = b""
-        for field in packet.fields:
-            payload += self._serialize_field(field)
-        return (
-            packet.id.value.to_bytes(1, "big")
-            + len(payload).to_bytes(4, "big")
-            + payload
+        payload = b"".join(self._serialize_field(field) for field in packet.fields)
+        return b"".join(
+            (
+                packet.id.value.to_bytes(1, "big"),
+                len(payload).to_bytes(4, "big"),
+                payload,
+            )
         )
 
     async def send(self, item: Packet) -> None:
@@ -125,12 +127,15 @@ class PacketStream(ObjectStream[Packet]):
         payload = await receive_exact(self.transport_stream, packet_length)
         assert len(payload) == packet_length
         fields = []
-        while len(payload) > 0:
-            field_id = int.from_bytes(payload[:1], "big")
-            field_length = int.from_bytes(payload[1:3], "big")
-            field_value = payload[3 : 3 + field_length]
-            fields.append(Packet.Field(field_id, field_value))
-            payload = payload[3 + field_length :]
+        offset = 0
+        while offset < packet_length:
+            field_id = payload[offset]
+            field_length = int.from_bytes(payload[offset + 1 : offset + 3], "big")
+            offset += 3
+            fields.append(
+                Packet.Field(field_id, payload[offset : offset + field_length])
+            )
+            offset += field_length
         return Packet(Packet.Type(packet_id), fields)
 
     async def aclose(self) -> None: